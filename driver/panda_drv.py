@@ -6,17 +6,32 @@ from __future__ import print_function
 import sys
 
 from parse_indent import parse_register_file
-registers = parse_register_file(sys.argv[1])
 
-base, fields = registers['*DRV']
-base = int(base)
 
-print('''\
+# Layout of the generated header.  The body is filled in from the list of
+# (name, address) pairs computed below, so changes to the formatting of the
+# header only need to be made here.
+HEADER_TEMPLATE = '''\
 /* Register definitions derived from configuration registers *DRV section.
  *
  * This file is automatically generated from driver/panda_drv.py.
  * Do not edit this file. */
-''')
-for name, field in fields:
-    reg = int(field)
-    print('#define %s 0x%05x' % (name, (base << 12) | (reg << 2)))
+
+%(defines)s'''
+DEFINE_TEMPLATE = '#define %s 0x%05x\n'
+
+
+def render_header(fields):
+    defines = ''.join(DEFINE_TEMPLATE % field for field in fields)
+    return HEADER_TEMPLATE % dict(defines = defines)
+
+
+registers = parse_register_file(sys.argv[1])
+
+base, fields = registers['*DRV']
+base = int(base)
+fields = [
+    (name, (base << 12) | (int(field) << 2))
+    for name, field in fields]
+
+sys.stdout.write(render_header(fields))
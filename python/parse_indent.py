@@ -44,63 +44,54 @@ class ParseFail(Exception):
         return 'Line %d: %s' % (self.line_no, self.message)
 
 
-# Implements line reading so that we can keep track of line numbers.  Also
-# supports one level of undo on the process of iterating through the lines
+# Implements line reading so that we can keep track of line numbers.
 class read_lines:
     def __init__(self, input_file):
         self.__input = input_file
-        self.__last = None
-        self.__undo = False
         self.line_no = 0
 
     def __iter__(self):
         return self
 
+    # Skips blank and comment lines and returns the indentation and content of
+    # the next line.  Iterating directly over the input avoids a separate call
+    # to next() for every line read, including the skipped lines.
     def __next__(self):
-        if not self.__undo:
-            self.__last = self.read_line()
-        self.__undo = False
-        return self.__last
-    next = __next__     # For Python2 compatibility
-
-    def undo(self):
-        self.__undo = True
-
-    def read_line(self):
-        while True:
-            line = next(self.__input)
+        for line in self.__input:
             self.line_no += 1
             content = line.lstrip(' ')
             if content[0] not in '#\n':
-                break
-        assert content[-1] == '\n', 'Unexpected end of input'
-        return len(line) - len(content), content[:-1]
+                assert content[-1] == '\n', 'Unexpected end of input'
+                return len(line) - len(content), content[:-1]
+        raise StopIteration
+    next = __next__     # For Python2 compatibility
 
     def check(self, test, message):
         if not test:
             raise ParseFail(self.line_no, message)
 
 
-# Parses lines at and above the given indentation, returns a nested list of the
-# resulting parse.
-def parse_indent_level(new_indent, lines):
+# Parses all lines, returns a nested list of the resulting parse.  The stack
+# holds the indentation and parse list of each currently open level, starting
+# with the top level at indentation 0.
+def parse_indent_level(lines):
     result = []
+    stack = [(0, result)]
     for indent, value in lines:
-        if indent < new_indent:
-            lines.undo()
-            break
-        elif indent > new_indent:
-            lines.undo()
-            lines.check(result, 'Invalid indentation')
-            lines.check(not result[-1][1], 'Sub-fields already parsed')
-            result[-1][1] = parse_indent_level(indent, lines)
-        else:
-            result.append([value, []])
+        while indent < stack[-1][0]:
+            stack.pop()
+        level, parse = stack[-1]
+        if indent > level:
+            lines.check(parse, 'Invalid indentation')
+            lines.check(not parse[-1][1], 'Sub-fields already parsed')
+            parse = parse[-1][1]
+            stack.append((indent, parse))
+        parse.append([value, []])
     return result
 
 def parse_indented_file(file_name):
-    lines = read_lines(open(file_name))
-    return parse_indent_level(0, lines)
+    with open(file_name) as input_file:
+        return parse_indent_level(read_lines(input_file))
 
 
 # This applies specific knowlege about the format of the register file to
@@ -1,20 +1,26 @@
 # Dummy extension service
 
+import array
 import logging
 
 
 class DummyField:
+    __slots__ = ('values',)
+
     def __init__(self, parent):
         logging.info('dummy field')
-        self.values = [0] * parent.count
+        # Field values are 32-bit registers, so hold them in a compact array
+        self.values = array.array('I', [0]) * parent.count
 
     def read(self, number):
         return self.values[number]
 
     def write(self, number, value):
-        self.values[number] = value
+        self.values[number] = value & 0xFFFFFFFF
 
 class PolyField:
+    __slots__ = ()
+
     def __init__(self, parent):
         logging.info('poly field')
 
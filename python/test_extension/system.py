@@ -14,13 +14,17 @@ class XADC:
         self.node = node
         self.offset = 0
         self.scale = 1
+        self.raw_file = None
 
-    def read_node(self, part):
-        filename = os.path.join(XADC_PATH, '%s_%s' % (self.node, part))
-        return float(open(filename).read())
-
+    # The raw node is opened on first use and then kept open: seeking back to
+    # the start of a sysfs attribute and reading it again returns a fresh value,
+    # so each read costs a seek and a read rather than an open and close.
     def read(self, number):
-        return self.scale * (self.offset + self.read_node('raw'))
+        if self.raw_file is None:
+            self.raw_file = open(
+                os.path.join(XADC_PATH, '%s_raw' % self.node))
+        self.raw_file.seek(0)
+        return self.scale * (self.offset + float(self.raw_file.read()))
 
 
 class Extension:
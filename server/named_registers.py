@@ -26,7 +26,10 @@ def fixup_fields(name, value):
 fields = [fixup_fields(name, value) for name, value in fields]
 
 
-print('''\
+# Layout of the generated header.  The two generated sections are filled in
+# from the list of fields, so changes to the formatting of the header only need
+# to be made here.
+HEADER_TEMPLATE = '''\
 /* Definitions of register names from *REG fields of the register configuration
  * file.  This file is re-read and confirmed equal on startup.
  *
@@ -34,17 +37,23 @@ print('''\
  * config_d/registers.
  *
  * DO NOT EDIT THIS FILE, edit the sources instead! */
-''')
-
-# First generate the #define statements
-print('#define REG_BLOCK_BASE %s' % base)
-print()
-for name, value, _ in fields:
-    print('#define %s %s' % (name, value))
-
-# Now generate offset name table used for checking.
-print('''
-static struct named_register named_registers[] = {''')
-for name, _, count in fields:
-    print('    [%s] = { "%s", %d, false },' % (name, name, count))
-print('};')
+
+#define REG_BLOCK_BASE %(base)s
+
+%(defines)s
+static struct named_register named_registers[] = {
+%(table)s};
+'''
+DEFINE_TEMPLATE = '#define %s %s\n'
+TABLE_TEMPLATE = '    [%s] = { "%s", %d, false },\n'
+
+
+def render_header(base, fields):
+    defines = ''.join(
+        DEFINE_TEMPLATE % (name, value) for name, value, _ in fields)
+    table = ''.join(
+        TABLE_TEMPLATE % (name, name, count) for name, _, count in fields)
+    return HEADER_TEMPLATE % dict(base = base, defines = defines, table = table)
+
+
+sys.stdout.write(render_header(base, fields))
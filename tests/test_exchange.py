@@ -26,7 +26,10 @@ server = socket.socket()
 server.connect((args.server, args.port))
 server.settimeout(0.5)
 
-server = server.makefile('rw')
+# Responses are read through a large binary buffer so that a multi-line
+# response is normally fetched from the socket in a single read.
+server_in = server.makefile('rb', 65536)
+server_out = server.makefile('wb')
 
 transcript = open(args.script, 'r')
 
@@ -34,37 +37,31 @@ transcript = open(args.script, 'r')
 def read_response(count):
     result = []
     for n in range(count):
-        line = server.readline()
+        line = server_in.readline()
         if line:
-            result.append(line[:-1])
+            result.append(line[:-1].decode())
         else:
             break
     return result
 
 
-# Returns next command response set read from transcript file
+# Returns next command response set read from transcript file.  Lines starting
+# with < are collected until the first line starting with >, after which the
+# response continues until the first line which is neither a response line nor
+# an inline comment.
 def transcript_readlines(line_no):
     to_send = []
     to_receive = []
 
-    # First scan for lines starting with <.
     for line in transcript:
         line_no += 1
-        if line[0] == '<':
-            to_send.append(line[2:-1])
-        elif line[0] == '>':
+        prefix = line[0]
+        if prefix == '>':
             to_receive.append(line[2:-1])
-            break
-
-    # Now read the remainder of the response
-    for line in transcript:
-        line_no += 1
-        if line[0] == '>':
-            to_receive.append(line[2:-1])
-        elif line[0] == '#':
-            # Allow inline comments in respone
-            pass
-        else:
+        elif not to_receive:
+            if prefix == '<':
+                to_send.append(line[2:-1])
+        elif prefix != '#':
             break
 
     return (to_send, to_receive, line_no)
@@ -78,9 +75,8 @@ while True:
         break
 
     start = time.time()
-    for line in tx:
-        server.write(line + '\n')
-    server.flush()
+    server_out.write(('\n'.join(tx) + '\n').encode())
+    server_out.flush()
     response = read_response(len(rx))
     end = time.time()
 